@@ -3,6 +3,7 @@ import logging
 import math
 
 from collections.abc import Iterator
+from itertools import groupby, pairwise
 from tola.assembly.assembly import Assembly
 from tola.assembly.assembly_stats import AssemblyStats
 from tola.assembly.build_utils import (
@@ -38,6 +39,9 @@ class BuildAssembly(Assembly):
         super().__init__(name, header, scaffolds, bp_per_texel)
         self.default_gap = default_gap
         self.found_fragments = {}
+        # Keys of found_fragments seen in more than one Scaffold. Used as an
+        # ordered set (values are always None) so that fixes and cuts are
+        # made in a reproducible order.
         self.fragments_found_more_than_once = {}
         self.chr_namer = ChrNamer()
         self.assembly_stats = AssemblyStats()
@@ -97,32 +101,35 @@ class BuildAssembly(Assembly):
             chr_namer.rename_unlocs_by_size()
 
     def discard_overhanging_fragments(self) -> None:
+        found = self.found_fragments
         multi = self.fragments_found_more_than_once
 
         while multi:
             ovr_resolver = OverhangResolver(self.error_length)
-            for fnd in multi.values():
+            for fk in multi:
+                fnd = found[fk]
                 for scffld in fnd.scaffolds:
-                    ovr_resolver.add_overhang_premise(fnd.fragment, scffld)
+                    ovr_resolver.add_overhang_premise(fnd, scffld)
             fixes_made = ovr_resolver.make_fixes()
             if fixes_made:
+                # At most one fix is made per FoundFragment in each round
                 for premise in fixes_made:
                     # Remove the Scaffold we fixed
-                    fk = premise.fragment.key_tuple
-                    if fxd := multi.get(fk):
-                        fxd.remove_scaffold(premise.scaffold)
-                        if fxd.scaffold_count <= 1:
-                            # Fragment is no longer in more than one Scaffold,
-                            # so remove it from fragments_found_more_than_once
-                            del multi[fk]
+                    fxd = premise.found
+                    fxd.remove_scaffold(premise.scaffold)
+                    if fxd.scaffold_count <= 1:
+                        # Fragment is no longer in more than one Scaffold,
+                        # so remove it from fragments_found_more_than_once
+                        del multi[fxd.fragment.key_tuple]
             else:
                 break
 
     def cut_remaining_overhangs(self) -> None:
+        found = self.found_fragments
         multi = self.fragments_found_more_than_once
 
-        for fnd in multi.values():
-            self.cut_fragments(fnd)
+        for fk in multi:
+            self.cut_fragments(found[fk])
 
         self.fragments_found_more_than_once = {}
 
@@ -146,10 +153,13 @@ class BuildAssembly(Assembly):
 
         self.assembly_stats.cuts += len(sub_fragments) - 1
 
-        logging.warning(
-            f"Contig:\n  {frgmnt.length:15,d}  {frgmnt}\ncut into:\n"
-            + "".join(f"  {sub.length:15,d}  {sub}\n" for sub in sub_fragments)
-        )
+        if logging.getLogger().isEnabledFor(logging.WARNING):
+            logging.warning(
+                "Contig:\n  %15s  %s\ncut into:\n%s",
+                f"{frgmnt.length:,d}",
+                frgmnt,
+                "".join(f"  {sub.length:15,d}  {sub}\n" for sub in sub_fragments),
+            )
 
     def qc_sub_fragments(
         self, fnd: FoundFragment, sub_fragments: list[Fragment]
@@ -161,14 +171,15 @@ class BuildAssembly(Assembly):
         abut_count = 0
         overlap_count = 0
         lgth = len(sub_fragments)
-        for i in range(0, lgth):
-            frag_a = sub_fragments[i]
-            for j in range(i + 1, lgth):
-                frag_b = sub_fragments[j]
-                if frag_a.abuts(frag_b):
-                    abut_count += 1
-                if frag_a.overlaps(frag_b):
-                    overlap_count += 1
+
+        # Sub fragments are a partition of the cut fragment, so once sorted
+        # by start only neighbouring pairs can abut or overlap.
+        sorted_subs = sorted(sub_fragments, key=lambda f: f.start)
+        for frag_a, frag_b in pairwise(sorted_subs):
+            if frag_a.abuts(frag_b):
+                abut_count += 1
+            if frag_a.overlaps(frag_b):
+                overlap_count += 1
 
         sub_frags_length = sum(f.length for f in sub_fragments)
 
@@ -189,9 +200,11 @@ class BuildAssembly(Assembly):
             raise ValueError(msg)
 
     def log_multi_scaffolds(self) -> None:
+        found = self.found_fragments
         multi = self.fragments_found_more_than_once
 
-        for fnd in multi.values():
+        for fk in multi:
+            fnd = found[fk]
             ff = fnd.fragment
             logging.warning(
                 f"\nFragment {ff} ({ff.length}) found in:\n"
@@ -209,13 +222,14 @@ class BuildAssembly(Assembly):
         multi = self.fragments_found_more_than_once
         for ff in scffld.fragments():
             ff_tuple = ff.key_tuple
-            if fnd := store.get(ff_tuple):
-                # Already have it, so record that we've found it more than
-                # once
-                multi[ff_tuple] = fnd
-            else:
+            fnd = store.get(ff_tuple)
+            if fnd is None:
                 fnd = FoundFragment(ff)
                 store[ff_tuple] = fnd
+            elif fnd.scaffold_count == 1:
+                # Already have it, so record that we've found it more than
+                # once
+                multi[ff_tuple] = None
             fnd.add_scaffold(scffld)
 
     def add_missing_scaffolds_from_input(self, input_asm: Assembly) -> None:
@@ -224,20 +238,22 @@ class BuildAssembly(Assembly):
         for scffld in input_asm.scaffolds:
             new_scffld = None
             last_added_i = None
-            for i, frag in scffld.idx_fragments():
-                if not found_frags.get(frag.key_tuple):
-                    if not new_scffld:
-                        new_scffld = Scaffold(scffld.name)
-                    if last_added_i is not None and not last_added_i == i - 1:
-                        # Last added row was not the previous row in the
-                        # scaffold
-                        prev_row = scffld.rows[i - 1]
-                        if isinstance(prev_row, Gap):
-                            new_scffld.add_row(prev_row)
-                        else:
-                            new_scffld.add_row(self.default_gap)
-                    new_scffld.add_row(frag)
-                    last_added_i = i
+            rows = scffld.rows
+            for i, frag in enumerate(rows):
+                if not isinstance(frag, Fragment) or frag.key_tuple in found_frags:
+                    continue
+                if not new_scffld:
+                    new_scffld = Scaffold(scffld.name)
+                if last_added_i is not None and not last_added_i == i - 1:
+                    # Last added row was not the previous row in the
+                    # scaffold
+                    prev_row = rows[i - 1]
+                    if isinstance(prev_row, Gap):
+                        new_scffld.add_row(prev_row)
+                    else:
+                        new_scffld.add_row(self.default_gap)
+                new_scffld.add_row(frag)
+                last_added_i = i
 
             if new_scffld:
                 chr_namer.make_chr_name(new_scffld)
@@ -256,7 +272,10 @@ class BuildAssembly(Assembly):
             else:
                 asm_key = None
                 asm_name = self.name
-            new_asm = assemblies.setdefault(asm_key, Assembly(asm_name))
+            new_asm = assemblies.get(asm_key)
+            if new_asm is None:
+                new_asm = Assembly(asm_name)
+                assemblies[asm_key] = new_asm
             new_asm.add_scaffold(scffld)
 
         asm_list = list(assemblies.values())
@@ -270,25 +289,20 @@ class BuildAssembly(Assembly):
 
     def scaffolds_fused_by_name(self) -> Iterator[Scaffold]:
         gap = self.default_gap
-        new_scffld = None
-        current_hap_chr = None, None
-        for scffld in self.scaffolds:
-            if not scffld.rows:
-                # discard_overhanging_fragments() may have removed the only
-                # row from an OverlapResult
-                continue
-            hap_chr = scffld.haplotype, scffld.name
-            if hap_chr != current_hap_chr:
-                if new_scffld:
-                    yield new_scffld
-                current_hap_chr = hap_chr
-                new_scffld = Scaffold(
-                    scffld.name, tag=scffld.tag, haplotype=scffld.haplotype
-                )
-            if isinstance(scffld, OverlapResult):
-                new_scffld.append_scaffold(scffld.to_scaffold(), gap)
-            else:
-                new_scffld.append_scaffold(scffld)
 
-        if new_scffld:
+        # discard_overhanging_fragments() may have removed the only row from
+        # an OverlapResult
+        with_rows = (s for s in self.scaffolds if s.rows)
+
+        for (hap, name), group in groupby(
+            with_rows, key=lambda s: (s.haplotype, s.name)
+        ):
+            new_scffld = None
+            for scffld in group:
+                if new_scffld is None:
+                    new_scffld = Scaffold(name, tag=scffld.tag, haplotype=hap)
+                if isinstance(scffld, OverlapResult):
+                    new_scffld.append_scaffold(scffld.to_scaffold(), gap)
+                else:
+                    new_scffld.append_scaffold(scffld)
             yield new_scffld
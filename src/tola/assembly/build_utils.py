@@ -3,13 +3,21 @@ Utility objects used by BuildAssembly
 """
 
 import logging
+import math
 import re
 import textwrap
+from itertools import pairwise
 
 from tola.assembly.fragment import Fragment
 from tola.assembly.overlap_result import OverlapResult
 from tola.assembly.scaffold import Scaffold
 
+_CHR_TAG_RE = re.compile(r"[A-Z]\d*$")
+_HAP_PREFIX_RE = re.compile(r"([^_]+)_")
+
+# Pretext tags which are neither chromosome nor haplotype names
+_NON_HAPLOTYPE_TAGS = frozenset(("Contaminant", "Cut", "Haplotig", "Unloc"))
+
 
 class ChrNamer:
     """
@@ -38,7 +46,9 @@ class ChrNamer:
         for tag in scaffold.fragment_tags():
             if tag == "Painted":
                 is_painted = True
-            elif m := re.match(r"[A-Z]\d*$", tag):
+            elif tag in _NON_HAPLOTYPE_TAGS:
+                continue
+            elif m := _CHR_TAG_RE.match(tag):
                 # This tag looks like a chromosome name
                 cn = m.group(0)
                 if chr_name and cn != chr_name:
@@ -48,7 +58,7 @@ class ChrNamer:
                     )
                     raise ValueError(msg)
                 chr_name = cn
-            elif tag not in ("Contaminant", "Cut", "Haplotig", "Unloc"):
+            else:
                 # Any tag that doesn't look like a chromosome name is assumed
                 # to be a haplotype, and we only expect to find one within
                 # each Pretext Scaffold
@@ -73,7 +83,7 @@ class ChrNamer:
                 # (This will fail if unplaced contigs from a haplotype appear
                 # before the first Scaffold assigned to that haplotype in the
                 # Pretext Assembly.)
-                if m := re.match(r"([^_]+)_", chr_name):
+                if m := _HAP_PREFIX_RE.match(chr_name):
                     prefix = m.group(1)
                     if prefix in self.haplotype_set:
                         haplotype = prefix
@@ -122,7 +132,11 @@ class ChrNamer:
         self.rename_by_size(self.unloc_scaffolds)
 
     def rename_by_size(self, scaffolds: list[Scaffold]) -> None:
-        if not scaffolds:
+        if len(scaffolds) < 2:
+            return
+        lengths = [s.length for s in scaffolds]
+        if all(a >= b for a, b in pairwise(lengths)):
+            # Already in size order, so the names would not change
             return
         names = [s.name for s in scaffolds]
         by_size = sorted(scaffolds, key=lambda s: s.length, reverse=True)
@@ -150,7 +164,14 @@ class FoundFragment:
         self.scaffolds.append(scaffold)
 
     def remove_scaffold(self, scaffold: Scaffold) -> None:
-        self.scaffolds.remove(scaffold)
+        # Search by identity, keeping the order of the remaining Scaffolds,
+        # which is used to break ties when resolving overhangs.
+        for i, s in enumerate(self.scaffolds):
+            if s is scaffold:
+                del self.scaffolds[i]
+                return
+        msg = f"Scaffold '{scaffold.name}' not found for Fragment {self.fragment}"
+        raise ValueError(msg)
 
 
 class OverhangPremise:
@@ -160,15 +181,57 @@ class OverhangPremise:
     Fragment is present in more than one OverlapResult.
     """
 
-    __slots__ = "scaffold", "fragment"
-
-    def __init__(self, scaffold: OverlapResult, fragment: Fragment):
+    __slots__ = (
+        "scaffold",
+        "found",
+        "fragment",
+        "is_start",
+        "bait_overlap",
+        "overhang_if_applied",
+        "overhang_error_delta_if_applied",
+    )
+
+    def __init__(self, scaffold: OverlapResult, found: FoundFragment, is_start: bool):
         self.scaffold = scaffold
-        self.fragment = fragment
+        self.found = found
+        self.fragment = found.fragment
+        self.is_start = is_start
+
+        # Discarding the start of an OverlapResult does not change the bait
+        # overlap of its last row, and discarding the end does not change
+        # that of its first row, so this is safe to compute up front even
+        # though other premises may be applied first.
+        if is_start:
+            self.bait_overlap = scaffold.start_row_bait_overlap
+        else:
+            self.bait_overlap = scaffold.end_row_bait_overlap
+
+        # Filled in by update_overhang_if_applied()
+        self.overhang_if_applied = None
+        self.overhang_error_delta_if_applied = None
+
+    def update_overhang_if_applied(self) -> None:
+        """
+        Work out the overhang, and the change in overhang error, if this
+        premise were applied to the OverlapResult as it is now. Premises
+        applied earlier in the same round of OverhangResolver.make_fixes()
+        may have removed rows from the same OverlapResult, so this must be
+        called when make_fixes() reaches this premise's Fragment.
+        """
+        scaffold = self.scaffold
+        if self.is_start:
+            self.overhang_if_applied = scaffold.overhang_if_start_removed()
+            current_overhang = scaffold.start_overhang
+        else:
+            self.overhang_if_applied = scaffold.overhang_if_end_removed()
+            current_overhang = scaffold.end_overhang
+        self.overhang_error_delta_if_applied = abs(self.overhang_if_applied) - abs(
+            current_overhang
+        )
 
     def __str__(self):
         return (
-            f"{self.__class__.__name__}\n"
+            f"{self.__class__.__name__} ({'start' if self.is_start else 'end'})\n"
             f"  bait overlap: {self.bait_overlap:12_d}\n  if applied:\n"
             f"      overhang: {self.overhang_if_applied:12_d}\n"
             f"   error delta: {self.overhang_error_delta_if_applied:12_d}\n\n"
@@ -190,43 +253,11 @@ class OverhangPremise:
     def makes_worse(self, err_length) -> bool:
         return not self.improves(err_length)
 
-
-class StartOverhangPremise(OverhangPremise):
-    @property
-    def bait_overlap(self) -> int:
-        return self.scaffold.start_row_bait_overlap
-
-    @property
-    def overhang_if_applied(self) -> int:
-        return self.scaffold.overhang_if_start_removed()
-
-    @property
-    def overhang_error_delta_if_applied(self) -> int:
-        return abs(self.scaffold.overhang_if_start_removed()) - abs(
-            self.scaffold.start_overhang
-        )
-
-    def apply(self) -> None:
-        self.scaffold.discard_start()
-
-
-class EndOverhangPremise(OverhangPremise):
-    @property
-    def bait_overlap(self) -> int:
-        return self.scaffold.end_row_bait_overlap
-
-    @property
-    def overhang_if_applied(self) -> int:
-        return self.scaffold.overhang_if_end_removed()
-
-    @property
-    def overhang_error_delta_if_applied(self) -> int:
-        return abs(self.scaffold.overhang_if_end_removed()) - abs(
-            self.scaffold.end_overhang
-        )
-
     def apply(self) -> None:
-        self.scaffold.discard_end()
+        if self.is_start:
+            self.scaffold.discard_start()
+        else:
+            self.scaffold.discard_end()
 
 
 class OverhangResolver:
@@ -241,23 +272,26 @@ class OverhangResolver:
         self.premises_by_fragment_key = {}
         self.error_length = error_length
 
-    def add_overhang_premise(self, fragment: Fragment, scffld: OverlapResult) -> None:
+    def add_overhang_premise(self, found: FoundFragment, scffld: OverlapResult) -> None:
+        fragment = found.fragment
         if scffld.rows[0] is fragment:
-            premise = StartOverhangPremise(scffld, fragment)
+            premise = OverhangPremise(scffld, found, is_start=True)
         elif scffld.rows[-1] is fragment:
-            premise = EndOverhangPremise(scffld, fragment)
+            premise = OverhangPremise(scffld, found, is_start=False)
         else:
             return
 
         fk = fragment.key_tuple
         self.premises_by_fragment_key.setdefault(fk, []).append(premise)
 
-    def make_fixes(self) -> list[OverlapResult]:
+    def make_fixes(self) -> list[OverhangPremise]:
         fixes_made = []
         err_length = self.error_length
 
         for prem_list in self.premises_by_fragment_key.values():
             prem_count = len(prem_list)
+            for prem in prem_list:
+                prem.update_overhang_if_applied()
 
             logging.debug(
                 f"\n{prem_count} OverhangPremises for {prem_list[0].fragment}:\n"
@@ -282,11 +316,18 @@ class OverhangResolver:
                 # Can only discard overhanging fragments present in more than
                 # one Scaffold, or we would be removing sequence data from
                 # the assembly.
-                best_to_worst = sorted(
-                    prem_list, key=lambda x: x.overhang_error_delta_if_applied
-                )
-                bst = best_to_worst[0]
-                nxt = best_to_worst[1]
+                # Only the best and next best premises are needed, so find
+                # them in one pass rather than sorting. Ties are resolved in
+                # list order, as a stable sort would.
+                bst = nxt = None
+                bst_key = nxt_key = math.inf
+                for prem in prem_list:
+                    key = prem.overhang_error_delta_if_applied
+                    if key < bst_key:
+                        nxt, nxt_key = bst, bst_key
+                        bst, bst_key = prem, key
+                    elif key < nxt_key:
+                        nxt, nxt_key = prem, key
                 if bst.improves(err_length) and nxt.makes_worse(err_length):
                     bst.apply()  # Remove the overhanging fragment
                     fixes_made.append(bst)
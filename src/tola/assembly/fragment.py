@@ -1,5 +1,5 @@
 class Fragment:
-    __slots__ = "_name", "_start", "_end", "_strand", "_tags"
+    __slots__ = "_name", "_start", "_end", "_strand", "_tags", "_key_tuple"
 
     def __init__(self, name, start, end, strand, tags=()):
         self._name = str(name)
@@ -7,6 +7,7 @@ class Fragment:
         self._end = int(end)
         self._strand = int(strand)
         self._tags = tags
+        self._key_tuple = self._name, self._start, self._end
 
         if self.strand not in (0, 1, -1):
             msg = f"strand '{self.strand}' should be one of: 0, 1, -1"
@@ -43,7 +44,7 @@ class Fragment:
 
     @property
     def key_tuple(self) -> tuple:
-        return self._name, self._start, self._end
+        return self._key_tuple
 
     #TODO: further develop this code to make a record of the coordinates of edits made by the curators
     def junction_tuple(self, othr) -> tuple:
@@ -85,7 +86,8 @@ class Fragment:
         return self.STRAND_STR[self.strand]
 
     def attr_values(self):
-        return tuple(self.__getattribute__(x) for x in self.__slots__)
+        # _key_tuple is derived from these, so is not included
+        return self._name, self._start, self._end, self._strand, self._tags
 
     def __eq__(self, othr):
         if self is othr:
@@ -1,3 +1,5 @@
+from bisect import bisect_left
+
 from tola.assembly.assembly import Assembly
 from tola.assembly.gap import Gap
 from tola.assembly.overlap_result import OverlapResult
@@ -67,40 +69,17 @@ class IndexedAssembly(Assembly):
         bait_start = bait.start
         bait_end = bait.end
 
-        # Binary search: a = left; m = midpoint; z = right
-        a = 0
-        z = len(idx)
-        ovr = None
-        while a < z:
-            m = a + ((z - a) // 2)
-            scffld_start = 1 if m == 0 else 1 + idx[m - 1]
-            scffld_end = idx[m]
-            if scffld_end < bait_start:
-                # Scaffold row at "m" is to the left of the bait
-                a = m + 1
-            elif scffld_start > bait_end:
-                # Scaffold row at "m" is to the right of the bait
-                z = m
-            else:
-                # Must be overlapping
-                ovr = m
-                break
-
-        if ovr is None:
+        # Rows are contiguous and idx holds their end positions in ascending
+        # order, so the first overlapping row is the first which ends at or
+        # after the bait start, and the last overlapping row is the first
+        # which ends at or after the bait end (or the last row).
+        i_ovr = bisect_left(idx, bait_start)
+        if i_ovr == len(idx):
             return None
-
-        # The span of overlapping entries may extend to the left or right
-        # of "ovr"
-        i_ovr = j_ovr = ovr
-        for i in range(ovr - 1, -1, -1):  # if ovr == 4, range will be [3, 2, 1, 0]
-            if idx[i] < bait_start:
-                break
-            i_ovr = i
-        for j in range(ovr + 1, len(idx)):
-            s_start = 1 if j == 0 else 1 + idx[j - 1]
-            if s_start > bait_end:
-                break
-            j_ovr = j
+        i_start = 1 if i_ovr == 0 else 1 + idx[i_ovr - 1]
+        if i_start > bait_end:
+            return None
+        j_ovr = min(bisect_left(idx, bait_end, i_ovr), len(idx) - 1)
 
         # Walk start and end pointers back to ignore Gaps on the ends
         while isinstance(scffld.rows[i_ovr], Gap):  # delete the gap at head
@@ -2,8 +2,10 @@ import math
 import random
 import sys
 
+import pytest
 from tola.assembly.assembly import Assembly
 from tola.assembly.build_assembly import BuildAssembly
+from tola.assembly.build_utils import FoundFragment
 from tola.assembly.fragment import Fragment
 from tola.assembly.gap import Gap
 from tola.assembly.indexed_assembly import IndexedAssembly
@@ -42,6 +44,40 @@ def test_shuffled_assembly(seed="Shuffled assembly"):
     assert str(m1) == str(m2)
 
 
+def test_qc_sub_fragments():
+    ba1 = BuildAssembly("qc")
+    fnd = FoundFragment(Fragment("scaffold_1", 1, 3000, 1))
+
+    # Sub fragments do not need to be in order
+    ba1.qc_sub_fragments(
+        fnd,
+        [
+            Fragment("scaffold_1", 2001, 3000, 1),
+            Fragment("scaffold_1", 1, 1000, 1),
+            Fragment("scaffold_1", 1001, 2000, 1),
+        ],
+    )
+
+    with pytest.raises(ValueError, match=r"overlaps in new sub fragments"):
+        ba1.qc_sub_fragments(
+            fnd,
+            [
+                Fragment("scaffold_1", 1, 1500, 1),
+                Fragment("scaffold_1", 1001, 2000, 1),
+                Fragment("scaffold_1", 2501, 3000, 1),
+            ],
+        )
+
+    with pytest.raises(ValueError, match=r"does not match orginal fragment length"):
+        ba1.qc_sub_fragments(
+            fnd,
+            [
+                Fragment("scaffold_1", 1, 1000, 1),
+                Fragment("scaffold_1", 2001, 3000, 1),
+            ],
+        )
+
+
 def shuffle_and_remap_assembly(asm, name):
     p1 = shuffled_assembly(asm, name)
     # print(p1)
@@ -0,0 +1,51 @@
+from tola.assembly.build_utils import FoundFragment, OverhangResolver
+from tola.assembly.fragment import Fragment
+from tola.assembly.gap import Gap
+from tola.assembly.overlap_result import OverlapResult
+
+
+def test_make_fixes_uses_current_overlap_results():
+    frag_a = Fragment("ctg_a", 1, 1_000, 1)
+    frag_b = Fragment("ctg_b", 1, 5_000, 1)
+    frag_c = Fragment("ctg_c", 1, 1_000, 1)
+    frag_d = Fragment("ctg_d", 1, 4_800, 1)
+
+    # A is shared by the end of U and the start of S, and B by the end of S
+    # and the start of T
+    ovr_u = OverlapResult(
+        bait=Fragment("s1", 1, 1_980, 1),
+        rows=[frag_c, frag_a],
+        start=1,
+        end=2_000,
+    )
+    ovr_s = OverlapResult(
+        bait=Fragment("s1", 1_990, 2_300, 1),
+        rows=[frag_a, Gap(200, "scaffold"), frag_b],
+        start=1_001,
+        end=7_200,
+    )
+    ovr_t = OverlapResult(
+        bait=Fragment("s1", 7_051, 12_000, 1),
+        rows=[frag_b, frag_d],
+        start=2_201,
+        end=12_000,
+    )
+
+    ovr_resolver = OverhangResolver(100)
+    for frag, scaffolds in ((frag_a, (ovr_u, ovr_s)), (frag_b, (ovr_s, ovr_t))):
+        fnd = FoundFragment(frag)
+        for scffld in scaffolds:
+            fnd.add_scaffold(scffld)
+        for scffld in scaffolds:
+            ovr_resolver.add_overhang_premise(fnd, scffld)
+
+    # Removing A from the start of S also removes the Gap, leaving S as just
+    # B. The premise for removing B from the end of S must be judged on that,
+    # or it looks worse than removing B from T, and B is wrongly removed
+    # from T.
+    fixes_made = ovr_resolver.make_fixes()
+    assert len(fixes_made) == 1
+    assert fixes_made[0].fragment is frag_a
+    assert fixes_made[0].scaffold is ovr_s
+    assert ovr_s.rows == [frag_b]
+    assert ovr_t.rows == [frag_b, frag_d]
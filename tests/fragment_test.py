@@ -50,6 +50,8 @@ def test_equals():
     assert f1 == f4
     assert f1 != f5
 
+    assert f3.attr_values() == ("chr1", 1, 20_000, 1, "Painted")
+
 
 def test_overlaps():
     f1 = Fragment("chr1", 1, 100, 1)
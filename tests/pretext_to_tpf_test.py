@@ -57,9 +57,16 @@ def run_assembly(data_dir, specimen):
 
 
 def diff_files(specimen, spec_path, test_path):
+    # Reading in text mode makes CRLF and LF line endings compare equal
+    spec_text = spec_path.read_text()
+    test_text = test_path.read_text()
+    if spec_text == test_text:
+        return
+
+    # Only build a diff for files which differ
     ctx_diff = difflib.context_diff(
-        spec_path.open("r").readlines(),
-        test_path.open("r").readlines(),
+        spec_text.splitlines(keepends=True),
+        test_text.splitlines(keepends=True),
         fromfile=f"{specimen}/{spec_path.name}",
         tofile=f"test/{test_path.name}",
     )